@@ -1,17 +1,29 @@
 'use strict';
 
-let clipboard = null;
-import('clipboardy').then(clipboardy => {
-    clipboard = clipboardy.default;
-});
 const { windowManager } = require("node-window-manager");
 var robot = require("robotjs");
 var express = require('express');
 var app = express();
 var Server = require('http').Server;
 var server = new Server(app);
+let clipboard = null;
+import('clipboardy').then(clipboardy => {
+    clipboard = clipboardy.default;
+    // only accept requests once everything they need is loaded
+    server.listen(8080);
+}).catch(err => {
+    console.error("failed to load clipboardy, not starting server:", err);
+    process.exit(1);
+});
+
+let cachedSignalWindow = null;
+
+class AppNotRunningError extends Error {
+    constructor(appName) {
+        super(appName + " is not running");
+    }
+}
 
-server.listen(8080);
 robot.setKeyboardDelay(1);
 
 // __dirname is used here along with package.json.pkg.assets
@@ -19,17 +31,13 @@ robot.setKeyboardDelay(1);
 // https://github.com/zeit/pkg#snapshot-filesystem
 app.use('/', express.static(__dirname + '/views'));
 
-app.get('/', function (req, res) {
-  res.sendFile(__dirname + '/views/index.html');
-});
-
 app.get('/app/signal/send/:name/:message', function (req, res) {
     openSignalContact(req.params.name);
     robot.keyTap("a", 'control');
     robot.keyTap('backspace');
     insertViaClipboard(req.params.message);
     robot.keyTap('enter');
-    res.json(windowManager.getWindows());
+    res.json(null);
 });
 
 app.get('/app/signal/open/:name?', function (req, res) {
@@ -37,9 +45,20 @@ app.get('/app/signal/open/:name?', function (req, res) {
     res.json(null);
 });
 
+// expected when the target app is closed, answered without logging a stack trace
+app.use(function (err, req, res, next) {
+    if (!(err instanceof AppNotRunningError)) {
+        return next(err);
+    }
+    console.warn(err.message);
+    res.status(503).json({error: err.message});
+});
+
 function openSignalContact(name) {
-    let signalWindows = windowManager.getWindows().filter(w => w.path.toLowerCase().includes("signal"));
-    let signalWindow = signalWindows.filter(w => w.getTitle().toLowerCase() === "signal")[0];
+    let signalWindow = getSignalWindow();
+    if (!signalWindow) {
+        throw new AppNotRunningError("signal");
+    }
     signalWindow.restore();
     signalWindow.bringToTop();
     robot.keyTap("escape");
@@ -51,8 +70,15 @@ function openSignalContact(name) {
     robot.keyTap("t", ["control", "shift"]);
 }
 
+function getSignalWindow() {
+    // enumerating all windows is expensive, so reuse the last match as long as it is still Signal's main window
+    if (!cachedSignalWindow || !cachedSignalWindow.isWindow() || cachedSignalWindow.getTitle().toLowerCase() !== "signal") {
+        cachedSignalWindow = windowManager.getWindows().find(w => w.path.toLowerCase().includes("signal") && w.getTitle().toLowerCase() === "signal");
+    }
+    return cachedSignalWindow;
+}
+
 function insertViaClipboard(text) {
-    console.log(clipboard);
     clipboard.writeSync(text);
     robot.keyTap("v", "control");
     clipboard.writeSync('');